@@ -0,0 +1,73 @@
+"""
+Numba-accelerated kernel for the Hill cipher known-plaintext search.
+
+The search for an invertible 2x2 plaintext matrix is pure integer
+arithmetic over a byte buffer, which Numba can JIT to native code. Numba
+is an optional accelerator: when it is not installed the same function
+runs as plain Python, so this module is importable either way.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# The 12 units mod 26, i.e. determinants with an inverse
+_UNITS = np.array([1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25], dtype=np.int32)
+
+
+def _scan_first_invertible(p: np.ndarray) -> int:
+    """
+    Scan letter indices for the first digraph-aligned 4-letter window whose
+    2x2 matrix is invertible mod 26.
+
+    Args:
+        p: Letter indices (ord - 65) of the prepared plaintext
+
+    Returns:
+        First valid even position, or -1 if none exists
+    """
+    n = p.shape[0]
+    for pos in range(0, n - 3, 2):
+        det = (p[pos] * p[pos + 3] - p[pos + 1] * p[pos + 2]) % 26
+        # gcd(det, 26) == 1 iff det is odd and not 13
+        if det % 2 == 1 and det != 13:
+            return pos
+    return -1
+
+
+def _scan_first_invertible_batched(p: np.ndarray) -> int:
+    """
+    NumPy fallback for the scan: compute every window determinant in one
+    vectorized pass and pick the first unit.
+    """
+    if p.shape[0] < 4:
+        return -1
+    dets = (p[0:-3:2] * p[3::2] - p[1:-2:2] * p[2:-1:2]) % 26
+    mask = np.isin(dets, _UNITS)
+    first = int(np.argmax(mask))
+    return 2 * first if mask[first] else -1
+
+
+if njit is not None:
+    _scan_first_invertible = njit(cache=True)(_scan_first_invertible)
+else:
+    _scan_first_invertible = _scan_first_invertible_batched
+
+
+def first_invertible_position(prepared: str) -> int:
+    """
+    Find the first position in prepared text where the 2x2 plaintext matrix
+    is invertible mod 26.
+
+    Args:
+        prepared: Prepared plaintext (uppercase letters only)
+
+    Returns:
+        First valid even position, or -1 if none exists
+    """
+    p = np.frombuffer(prepared.encode('ascii'), dtype=np.uint8).astype(np.int32) - 65
+    return int(_scan_first_invertible(p))
@@ -0,0 +1,63 @@
+"""
+Numba-accelerated kernel for bulk Playfair digraph substitution.
+
+Applying the precomputed 26x26x2 pair table to prepared text is a tight
+integer gather, which Numba can JIT to native code without the temporary
+arrays of the NumPy fancy-indexing path. Numba is an optional accelerator:
+when it is not installed the same function runs as the NumPy gather, so
+this module is importable either way.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _substitute_pairs(idx: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """
+    Map each letter-index pair through the substitution table.
+
+    Args:
+        idx: Letter indices (ord - 65) of prepared text, even length
+        table: (26, 26, 2) uint8 substitution table
+
+    Returns:
+        Substituted output bytes, same length as idx
+    """
+    n = idx.shape[0] // 2
+    out = np.empty(2 * n, dtype=np.uint8)
+    for i in range(n):
+        a = idx[2 * i]
+        b = idx[2 * i + 1]
+        out[2 * i] = table[a, b, 0]
+        out[2 * i + 1] = table[a, b, 1]
+    return out
+
+
+def _substitute_pairs_batched(idx: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """NumPy fallback for the gather: one fancy-indexing pass over all pairs."""
+    return table[idx[0::2], idx[1::2]].reshape(-1)
+
+
+if njit is not None:
+    _substitute_pairs = njit(cache=True)(_substitute_pairs)
+else:
+    _substitute_pairs = _substitute_pairs_batched
+
+
+def substitute_digraphs(prepared: str, table: np.ndarray) -> str:
+    """
+    Transform even-length prepared text through a digraph substitution table.
+
+    Args:
+        prepared: Prepared text (uppercase letters, even length)
+        table: (26, 26, 2) uint8 table from PlayfairCipher._build_cipher_tables
+
+    Returns:
+        Transformed text
+    """
+    idx = np.frombuffer(prepared.encode('ascii'), dtype=np.uint8) - 65
+    return _substitute_pairs(idx, table).tobytes().decode('ascii')
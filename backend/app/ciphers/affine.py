@@ -17,8 +17,48 @@ Valid values for 'a': 1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25
 (These are coprime with 26)
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from ..utils.math_utils import mod, gcd, mod_inverse
+from ..utils.math_utils import mod_inverse
+
+_UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWERCASE = _UPPERCASE.lower()
+
+# Only 12 values of 'a' are coprime with 26, so precompute their inverses
+# once instead of running gcd/extended-Euclid per call
+_A_INVERSE = {a: mod_inverse(a, 26) for a in (1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25)}
+_VALID_A = frozenset(_A_INVERSE)
+
+
+@lru_cache(maxsize=None)
+def _affine_table(a: int, b: int) -> Dict[int, int]:
+    """
+    Build the encryption translation table for keys (a, b), cached per key pair.
+
+    There are only 26 distinct outputs, so the substitution is computed once
+    and applied with a single C-level str.translate call.
+    """
+    enc_upper = ''.join(chr((a * i + b) % 26 + ord('A')) for i in range(26))
+    return str.maketrans(_UPPERCASE + _LOWERCASE, enc_upper + enc_upper.lower())
+
+
+@lru_cache(maxsize=None)
+def _affine_inv_table(a_inverse: int, b: int) -> Dict[int, int]:
+    """Build the decryption translation table for keys (a, b), cached per key pair."""
+    dec_upper = ''.join(chr(a_inverse * (i - b) % 26 + ord('A')) for i in range(26))
+    return str.maketrans(_UPPERCASE + _LOWERCASE, dec_upper + dec_upper.lower())
+
+
+@lru_cache(maxsize=4096)
+def _encrypt_text(text: str, a: int, b: int) -> str:
+    """Pure Affine encryption transform, memoized per (text, a, b)."""
+    return text.translate(_affine_table(a, b))
+
+
+@lru_cache(maxsize=4096)
+def _decrypt_text(text: str, a_inverse: int, b: int) -> str:
+    """Pure Affine decryption transform, memoized per (text, a_inverse, b)."""
+    return text.translate(_affine_inv_table(a_inverse, b))
 
 
 class AffineCipher:
@@ -38,7 +78,7 @@ class AffineCipher:
         Returns:
             True if valid, False otherwise
         """
-        return gcd(a, 26) == 1
+        return a % 26 in _VALID_A
 
     @staticmethod
     def get_inverse(a: int) -> Optional[int]:
@@ -51,10 +91,10 @@ class AffineCipher:
         Returns:
             Inverse if exists, None otherwise
         """
-        return mod_inverse(a, 26)
+        return _A_INVERSE.get(a % 26)
 
     @staticmethod
-    def encrypt(plaintext: str, a: int, b: int) -> Dict[str, Any]:
+    def encrypt(plaintext: str, a: int, b: int, *, include_steps: bool = False) -> Dict[str, Any]:
         """
         Encrypt plaintext using Affine cipher.
         E(x) = (ax + b) mod 26
@@ -63,6 +103,7 @@ class AffineCipher:
             plaintext: Text to encrypt
             a: Multiplicative key (must be coprime with 26)
             b: Additive key
+            include_steps: Whether to build the step-by-step breakdown
 
         Returns:
             Dictionary with result and step-by-step breakdown
@@ -74,36 +115,33 @@ class AffineCipher:
                 "valid_a_values": AffineCipher.VALID_A_VALUES
             }
 
-        b = mod(b, 26)
-        result = ""
-        steps = []
+        b = b % 26
 
-        for char in plaintext.upper():
-            if char.isalpha():
-                x = ord(char) - ord('A')
+        # Single bulk translate through the cached substitution table
+        text = plaintext if plaintext.isupper() else plaintext.upper()
+        result = _encrypt_text(text, a, b)
 
-                # E(x) = (ax + b) mod 26
-                encrypted_pos = mod(a * x + b, 26)
-                encrypted_char = chr(encrypted_pos + ord('A'))
-
-                result += encrypted_char
-                steps.append({
+        steps = []
+        if include_steps:
+            steps = [
+                {
                     "original": char,
-                    "x": x,
+                    "x": ord(char) - ord('A'),
                     "a": a,
                     "b": b,
-                    "encrypted_pos": encrypted_pos,
+                    "encrypted_pos": ord(encrypted_char) - ord('A'),
                     "encrypted": encrypted_char,
-                    "calculation": f"E({char}) = ({a} × {x} + {b}) mod 26 = {encrypted_pos} = {encrypted_char}"
-                })
-            else:
-                result += char
+                    "calculation": f"E({char}) = ({a} × {ord(char) - ord('A')} + {b}) mod 26 = {ord(encrypted_char) - ord('A')} = {encrypted_char}"
+                }
+                for char, encrypted_char in zip(text, result)
+                if 'A' <= char <= 'Z'
+            ]
 
         a_inverse = AffineCipher.get_inverse(a)
 
         return {
             "result": result,
-            "steps": steps,
+            "steps": steps if include_steps else None,
             "key": {"a": a, "b": b},
             "a_inverse": a_inverse,
             "formula": f"E(x) = ({a}x + {b}) mod 26",
@@ -111,7 +149,7 @@ class AffineCipher:
         }
 
     @staticmethod
-    def decrypt(ciphertext: str, a: int, b: int) -> Dict[str, Any]:
+    def decrypt(ciphertext: str, a: int, b: int, *, include_steps: bool = False) -> Dict[str, Any]:
         """
         Decrypt ciphertext using Affine cipher.
         D(x) = a^(-1)(x - b) mod 26
@@ -120,6 +158,7 @@ class AffineCipher:
             ciphertext: Text to decrypt
             a: Multiplicative key used for encryption
             b: Additive key used for encryption
+            include_steps: Whether to build the step-by-step breakdown
 
         Returns:
             Dictionary with result and step-by-step breakdown
@@ -133,35 +172,30 @@ class AffineCipher:
 
         # Get modular inverse of 'a'
         a_inverse = AffineCipher.get_inverse(a)
-        b = mod(b, 26)
+        b = b % 26
 
-        result = ""
-        steps = []
-
-        for char in ciphertext.upper():
-            if char.isalpha():
-                y = ord(char) - ord('A')
+        text = ciphertext if ciphertext.isupper() else ciphertext.upper()
+        result = _decrypt_text(text, a_inverse, b)
 
-                # D(y) = a^(-1)(y - b) mod 26
-                decrypted_pos = mod(a_inverse * (y - b), 26)
-                decrypted_char = chr(decrypted_pos + ord('A'))
-
-                result += decrypted_char
-                steps.append({
+        steps = []
+        if include_steps:
+            steps = [
+                {
                     "original": char,
-                    "y": y,
+                    "y": ord(char) - ord('A'),
                     "a_inverse": a_inverse,
                     "b": b,
-                    "decrypted_pos": decrypted_pos,
+                    "decrypted_pos": ord(decrypted_char) - ord('A'),
                     "decrypted": decrypted_char,
-                    "calculation": f"D({char}) = {a_inverse} × ({y} - {b}) mod 26 = {decrypted_pos} = {decrypted_char}"
-                })
-            else:
-                result += char
+                    "calculation": f"D({char}) = {a_inverse} × ({ord(char) - ord('A')} - {b}) mod 26 = {ord(decrypted_char) - ord('A')} = {decrypted_char}"
+                }
+                for char, decrypted_char in zip(text, result)
+                if 'A' <= char <= 'Z'
+            ]
 
         return {
             "result": result,
-            "steps": steps,
+            "steps": steps if include_steps else None,
             "key": {"a": a, "b": b},
             "a_inverse": a_inverse,
             "formula": f"D(x) = {a_inverse}(x - {b}) mod 26",
@@ -186,7 +220,7 @@ class AffineCipher:
         mapping = {}
         for i in range(26):
             original = chr(i + ord('A'))
-            encrypted_pos = mod(a * i + b, 26)
+            encrypted_pos = (a * i + b) % 26
             encrypted = chr(encrypted_pos + ord('A'))
             mapping[original] = encrypted
 
@@ -12,54 +12,119 @@ Where:
 - k is the shift key (0-25)
 """
 
+import numpy as np
+
+from functools import lru_cache
 from typing import List, Dict, Any
-from ..utils.math_utils import mod
+
+_UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWERCASE = _UPPERCASE.lower()
+
+# Precompiled step templates applied via format_map, which is cheaper than
+# re-evaluating an f-string with six interpolations per character
+_STEP_FMT_ENCRYPT = "{char}({old}) + {shift} = {new_char}({new})"
+_STEP_FMT_DECRYPT = "{char}({old}) - {shift} = {new_char}({new})"
+
+
+@lru_cache(maxsize=26)
+def _caesar_table(shift: int) -> Dict[int, int]:
+    """
+    Build the translation table for a given shift (cached per shift).
+
+    The table maps both cases so the whole transform can run as a single
+    C-level str.translate call instead of a per-character Python loop.
+    """
+    shifted = _UPPERCASE[shift:] + _UPPERCASE[:shift]
+    return str.maketrans(_UPPERCASE + _LOWERCASE, shifted + shifted.lower())
+
+
+@lru_cache(maxsize=4096)
+def _bulk_shift(text: str, shift: int) -> str:
+    """
+    Pure Caesar transform of uppercased text, memoized per (text, shift).
+
+    Web clients often re-submit the same text while tweaking settings, so
+    repeated requests are answered straight from the cache.
+    """
+    try:
+        buf = text.encode('latin-1')
+    except UnicodeEncodeError:
+        return text.translate(_caesar_table(shift))
+
+    arr = np.frombuffer(buf, dtype=np.uint8).astype(np.int16)
+    is_letter = (arr >= 65) & (arr < 91)
+    shifted = (arr - 65 + shift) % 26 + 65
+    return np.where(is_letter, shifted, arr).astype(np.uint8).tobytes().decode('latin-1')
 
 
 class CaesarCipher:
     """Caesar Cipher encryption and decryption."""
 
     @staticmethod
-    def encrypt(plaintext: str, shift: int) -> Dict[str, Any]:
+    def fast_encrypt(plaintext: str, shift: int) -> str:
+        """
+        Bulk Caesar shift of a whole string via branchless NumPy arithmetic.
+
+        The uppercased text is processed as a uint8 buffer: a single mask
+        selects the letters and the shift is applied to the entire array at
+        once, leaving other characters untouched. Falls back to the cached
+        translate table for input that does not fit in Latin-1.
+
+        Args:
+            plaintext: Text to encrypt
+            shift: Number of positions to shift (0-25)
+
+        Returns:
+            Encrypted text (uppercased)
+        """
+        if not plaintext.isupper():
+            plaintext = plaintext.upper()
+        return _bulk_shift(plaintext, shift % 26)
+
+    @staticmethod
+    def encrypt(plaintext: str, shift: int, *, include_steps: bool = False) -> Dict[str, Any]:
         """
         Encrypt plaintext using Caesar cipher.
 
         Args:
             plaintext: Text to encrypt
             shift: Number of positions to shift (0-25)
+            include_steps: Whether to build the step-by-step breakdown
 
         Returns:
             Dictionary with result and step-by-step breakdown
         """
         # Normalize shift to 0-25 range
-        shift = mod(shift, 26)
-
-        result = ""
-        steps = []
-
-        for char in plaintext.upper():
-            if char.isalpha():
-                # Convert to number (A=0, B=1, ..., Z=25)
-                original_pos = ord(char) - ord('A')
-
-                # Apply shift
-                new_pos = mod(original_pos + shift, 26)
-
-                # Convert back to letter
-                new_char = chr(new_pos + ord('A'))
-
-                result += new_char
-                steps.append({
-                    "original": char,
-                    "original_pos": original_pos,
-                    "shift": shift,
-                    "new_pos": new_pos,
-                    "encrypted": new_char,
-                    "calculation": f"{char}({original_pos}) + {shift} = {new_char}({new_pos})"
-                })
-            else:
-                # Keep non-alphabetic characters unchanged
-                result += char
+        shift = shift % 26
+
+        if not include_steps:
+            return {
+                "result": CaesarCipher.fast_encrypt(plaintext, shift),
+                "steps": None,
+                "shift": shift,
+                "operation": "encrypt"
+            }
+
+        # Single bulk translate instead of a per-character loop
+        text = plaintext if plaintext.isupper() else plaintext.upper()
+        result = text.translate(_caesar_table(shift))
+
+        fmt = _STEP_FMT_ENCRYPT.format_map
+        steps = [
+            {
+                "original": char,
+                "original_pos": old,
+                "shift": shift,
+                "new_pos": new,
+                "encrypted": new_char,
+                "calculation": fmt({"char": char, "old": old, "shift": shift, "new_char": new_char, "new": new})
+            }
+            for char, new_char, old, new in (
+                (c, n, ord(c) - 65, ord(n) - 65)
+                for c, n in zip(text, result)
+                if 'A' <= c <= 'Z'
+            )
+        ]
 
         return {
             "result": result,
@@ -69,40 +134,48 @@ class CaesarCipher:
         }
 
     @staticmethod
-    def decrypt(ciphertext: str, shift: int) -> Dict[str, Any]:
+    def decrypt(ciphertext: str, shift: int, *, include_steps: bool = False) -> Dict[str, Any]:
         """
         Decrypt ciphertext using Caesar cipher.
 
         Args:
             ciphertext: Text to decrypt
             shift: Number of positions that was used for encryption
+            include_steps: Whether to build the step-by-step breakdown
 
         Returns:
             Dictionary with result and step-by-step breakdown
         """
         # Decryption is just encryption with negative shift
-        shift = mod(shift, 26)
-
-        result = ""
-        steps = []
-
-        for char in ciphertext.upper():
-            if char.isalpha():
-                original_pos = ord(char) - ord('A')
-                new_pos = mod(original_pos - shift, 26)
-                new_char = chr(new_pos + ord('A'))
-
-                result += new_char
-                steps.append({
-                    "original": char,
-                    "original_pos": original_pos,
-                    "shift": shift,
-                    "new_pos": new_pos,
-                    "decrypted": new_char,
-                    "calculation": f"{char}({original_pos}) - {shift} = {new_char}({new_pos})"
-                })
-            else:
-                result += char
+        shift = shift % 26
+
+        if not include_steps:
+            return {
+                "result": CaesarCipher.fast_encrypt(ciphertext, -shift % 26),
+                "steps": None,
+                "shift": shift,
+                "operation": "decrypt"
+            }
+
+        text = ciphertext if ciphertext.isupper() else ciphertext.upper()
+        result = text.translate(_caesar_table(-shift % 26))
+
+        fmt = _STEP_FMT_DECRYPT.format_map
+        steps = [
+            {
+                "original": char,
+                "original_pos": old,
+                "shift": shift,
+                "new_pos": new,
+                "decrypted": new_char,
+                "calculation": fmt({"char": char, "old": old, "shift": shift, "new_char": new_char, "new": new})
+            }
+            for char, new_char, old, new in (
+                (c, n, ord(c) - 65, ord(n) - 65)
+                for c, n in zip(text, result)
+                if 'A' <= c <= 'Z'
+            )
+        ]
 
         return {
             "result": result,
@@ -122,12 +195,12 @@ class CaesarCipher:
         Returns:
             Dictionary mapping original letters to encrypted letters
         """
-        shift = mod(shift, 26)
+        shift = shift % 26
         mapping = {}
 
         for i in range(26):
             original = chr(i + ord('A'))
-            encrypted = chr(mod(i + shift, 26) + ord('A'))
+            encrypted = chr((i + shift) % 26 + ord('A'))
             mapping[original] = encrypted
 
         return mapping
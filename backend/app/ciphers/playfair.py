@@ -21,12 +21,106 @@ Example with keyword "MONARCHY":
     U V W X Z
 """
 
+import numpy as np
+
+from array import array
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
+from ._playfair_numba import substitute_digraphs
+
+# Bytes-level cleanup: J folds onto I and everything outside A-Z is
+# deleted in one bytes.translate pass over the ASCII buffer
+_JMAP = bytes.maketrans(b'J', b'I')
+_NONALPHA = bytes(c for c in range(256) if not 65 <= c <= 90)
+
+
+def _clean(text: str) -> str:
+    """
+    Uppercase, fold J onto I and strip non-letters, working in bytes.
+
+    Encoding once and running bytes.upper/translate keeps the whole
+    cleanup in C over a flat byte buffer with no per-character Unicode
+    bookkeeping; non-ASCII input is dropped rather than leaking past the
+    A-Z tables downstream.
+    """
+    return text.encode('ascii', 'ignore').upper().translate(_JMAP, _NONALPHA).decode('ascii')
+
+# The 25-letter cipher alphabet (I and J share a cell, so no J)
+_ALPHABET25 = 'ABCDEFGHIKLMNOPQRSTUVWXYZ'
+
+# Below this size the plain Python digraph loop beats NumPy call overhead
+_BULK_THRESHOLD = 64
+
+_X = ord('X')
+
+
+def _split_digraphs_bulk(text: str) -> List[str]:
+    """
+    Vectorized digraph splitting for long cleaned text.
+
+    Each 'X' insertion shifts the pair alignment of everything after it, so
+    fillers cannot all be placed in one shot. Instead, one vector compare
+    finds the first equal-aligned pair, the text up to it is emitted in
+    bulk with the filler, and the scan resumes at the pair's second letter.
+    Text without repeated pairs is copied in a single pass.
+
+    Args:
+        text: Cleaned text (uppercase letters only)
+
+    Returns:
+        List of digraphs
+    """
+    arr = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    n = arr.shape[0]
+    out = bytearray()
+    pos = 0
+
+    while pos < n:
+        sub = arr[pos:]
+        m = sub.shape[0]
+        eq = sub[0:m - 1:2] == sub[1:m:2]
+        if not eq.any():
+            out += sub.tobytes()
+            break
+        j = int(np.argmax(eq))
+        out += sub[:2 * j + 1].tobytes()
+        out.append(_X)
+        pos += 2 * j + 1
+
+    if len(out) % 2:
+        out.append(_X)
+
+    s = out.decode('ascii')
+    return [s[i:i + 2] for i in range(0, len(s), 2)]
 
 
 class PlayfairCipher:
     """Playfair Cipher encryption and decryption."""
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_flat(keyword: str) -> str:
+        """
+        Generate the Playfair matrix as a flat 25-character string.
+
+        The flat form is the internal working representation: cell (r, c)
+        is flat[r*5 + c], one contiguous index instead of two pointer
+        chases through nested lists.
+
+        Args:
+            keyword: The keyword to generate the matrix from
+
+        Returns:
+            25-character string, rows concatenated
+        """
+        # Prepare keyword: uppercase, replace J with I, remove non-alpha
+        keyword = _clean(keyword)
+
+        # Keyword letters first (order-preserving dedupe), then the rest of
+        # the alphabet with the used letters deleted in one translate pass
+        prefix = ''.join(dict.fromkeys(keyword))
+        return prefix + _ALPHABET25.translate(str.maketrans('', '', prefix))
+
     @staticmethod
     def generate_matrix(keyword: str) -> List[List[str]]:
         """
@@ -38,32 +132,94 @@ class PlayfairCipher:
         Returns:
             5x5 matrix as list of lists
         """
-        # Prepare keyword: uppercase, replace J with I, remove non-alpha
-        keyword = keyword.upper().replace('J', 'I')
-        keyword = ''.join(c for c in keyword if c.isalpha())
+        flat = PlayfairCipher._generate_flat(keyword)
+        return [list(flat[i:i + 5]) for i in range(0, 25, 5)]
 
-        # Build matrix with keyword letters first, then remaining alphabet
-        seen = set()
-        matrix_chars = []
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_position_table(flat: str) -> array:
+        """
+        Build a byte → cell lookup table for the flat matrix.
+
+        A 128-entry signed byte array indexed by the raw ASCII value, both
+        cases, holding row*5 + col (split with divmod) or -1 for bytes not
+        in the matrix. One memory load per lookup, no case conversion or
+        index arithmetic. J shares I's cell.
+
+        Args:
+            flat: The matrix as a flat 25-character string
+
+        Returns:
+            128-entry array('b') of packed cell indices
+        """
+        pos_table = array('b', [-1]) * 128
+        for i, char in enumerate(flat):
+            code = ord(char)
+            pos_table[code] = i
+            pos_table[code + 32] = i
+        pos_table[ord('J')] = pos_table[ord('I')]
+        pos_table[ord('j')] = pos_table[ord('I')]
+        return pos_table
 
-        # Add keyword characters (no duplicates)
-        for char in keyword:
-            if char not in seen:
-                seen.add(char)
-                matrix_chars.append(char)
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_cipher_tables(flat: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build full 26x26 digraph substitution tables for a key matrix.
+
+        Each table maps a letter pair (i1, i2) to its two output bytes, so
+        bulk encryption/decryption collapses to one NumPy gather. All 676
+        pairs are enumerated once per key; at 26*26*2 bytes per table this
+        trades ~1.3 KB of RAM for skipping the rule branches per digraph.
+
+        Args:
+            flat: The matrix as a flat 25-character string
+
+        Returns:
+            (enc_table, dec_table) uint8 arrays of shape (26, 26, 2)
+        """
+        pos_table = PlayfairCipher._build_position_table(flat)
+        cells = flat.encode('ascii')
+        enc_table = np.zeros((26, 26, 2), dtype=np.uint8)
+        dec_table = np.zeros((26, 26, 2), dtype=np.uint8)
+
+        for i1 in range(26):
+            row1, col1 = divmod(pos_table[65 + i1], 5)
+            for i2 in range(26):
+                row2, col2 = divmod(pos_table[65 + i2], 5)
+                if row1 == row2:
+                    enc_table[i1, i2, 0] = cells[row1 * 5 + (col1 + 1) % 5]
+                    enc_table[i1, i2, 1] = cells[row2 * 5 + (col2 + 1) % 5]
+                    dec_table[i1, i2, 0] = cells[row1 * 5 + (col1 - 1) % 5]
+                    dec_table[i1, i2, 1] = cells[row2 * 5 + (col2 - 1) % 5]
+                elif col1 == col2:
+                    enc_table[i1, i2, 0] = cells[(row1 + 1) % 5 * 5 + col1]
+                    enc_table[i1, i2, 1] = cells[(row2 + 1) % 5 * 5 + col2]
+                    dec_table[i1, i2, 0] = cells[(row1 - 1) % 5 * 5 + col1]
+                    dec_table[i1, i2, 1] = cells[(row2 - 1) % 5 * 5 + col2]
+                else:
+                    swapped = cells[row1 * 5 + col2], cells[row2 * 5 + col1]
+                    enc_table[i1, i2, 0] = swapped[0]
+                    enc_table[i1, i2, 1] = swapped[1]
+                    dec_table[i1, i2, 0] = swapped[0]
+                    dec_table[i1, i2, 1] = swapped[1]
+
+        return enc_table, dec_table
 
-        # Add remaining alphabet (except J)
-        for char in 'ABCDEFGHIKLMNOPQRSTUVWXYZ':  # Note: no J
-            if char not in seen:
-                seen.add(char)
-                matrix_chars.append(char)
+    @staticmethod
+    def _apply_table(prepared: str, table: np.ndarray) -> str:
+        """
+        Transform even-length prepared text with one gather into a digraph
+        substitution table.
 
-        # Convert to 5x5 matrix
-        matrix = []
-        for i in range(0, 25, 5):
-            matrix.append(matrix_chars[i:i + 5])
+        Args:
+            prepared: Prepared text (uppercase letters, even length)
+            table: (26, 26, 2) substitution table from _build_cipher_tables
 
-        return matrix
+        Returns:
+            Transformed text
+        """
+        return substitute_digraphs(prepared, table)
 
     @staticmethod
     def find_position(matrix: List[List[str]], char: str) -> Tuple[int, int]:
@@ -72,21 +228,17 @@ class PlayfairCipher:
 
         Args:
             matrix: The 5x5 Playfair matrix
-            char: Character to find
+            char: Character to find; the position table itself maps both
+                cases and folds J onto I, so no per-call normalization is
+                needed
 
         Returns:
-            Tuple of (row, column)
+            Tuple of (row, column), or (-1, -1) if char is not in the matrix
         """
-        char = char.upper()
-        if char == 'J':
-            char = 'I'
-
-        for row in range(5):
-            for col in range(5):
-                if matrix[row][col] == char:
-                    return (row, col)
-
-        return (-1, -1)  # Should never happen for valid input
+        flat = ''.join(''.join(row) for row in matrix)
+        code = ord(char)
+        cell = PlayfairCipher._build_position_table(flat)[code] if code < 128 else -1
+        return divmod(cell, 5) if cell >= 0 else (-1, -1)
 
     @staticmethod
     def prepare_text(text: str) -> List[str]:
@@ -105,17 +257,21 @@ class PlayfairCipher:
             List of digraphs
         """
         # Clean text
-        text = text.upper().replace('J', 'I')
-        text = ''.join(c for c in text if c.isalpha())
+        text = _clean(text)
+
+        if len(text) >= _BULK_THRESHOLD:
+            return _split_digraphs_bulk(text)
 
         # Split into digraphs
         digraphs = []
+        append = digraphs.append
+        n = len(text)
         i = 0
 
-        while i < len(text):
+        while i < n:
             first = text[i]
 
-            if i + 1 >= len(text):
+            if i + 1 >= n:
                 # Odd length - pad with X
                 second = 'X'
                 i += 1
@@ -127,64 +283,64 @@ class PlayfairCipher:
                 second = text[i + 1]
                 i += 2
 
-            digraphs.append(first + second)
+            append(first + second)
 
         return digraphs
 
     @staticmethod
-    def encrypt(plaintext: str, keyword: str) -> Dict[str, Any]:
+    def encrypt(plaintext: str, keyword: str, *, include_steps: bool = False) -> Dict[str, Any]:
         """
         Encrypt plaintext using Playfair cipher.
 
         Args:
             plaintext: Text to encrypt
             keyword: Keyword to generate the matrix
+            include_steps: Whether to build the step-by-step breakdown
 
         Returns:
             Dictionary with result and step-by-step breakdown
         """
-        matrix = PlayfairCipher.generate_matrix(keyword)
+        flat = PlayfairCipher._generate_flat(keyword)
         digraphs = PlayfairCipher.prepare_text(plaintext)
-
-        result = ""
-        steps = []
-
-        for digraph in digraphs:
-            char1, char2 = digraph[0], digraph[1]
-            row1, col1 = PlayfairCipher.find_position(matrix, char1)
-            row2, col2 = PlayfairCipher.find_position(matrix, char2)
-
-            step_info = {
-                "digraph": digraph,
-                "pos1": f"({row1},{col1})",
-                "pos2": f"({row2},{col2})",
-            }
-
-            if row1 == row2:
-                # Same row - shift right
-                new_col1 = (col1 + 1) % 5
-                new_col2 = (col2 + 1) % 5
-                encrypted = matrix[row1][new_col1] + matrix[row2][new_col2]
-                step_info["rule"] = "Same Row (shift right)"
-            elif col1 == col2:
-                # Same column - shift down
-                new_row1 = (row1 + 1) % 5
-                new_row2 = (row2 + 1) % 5
-                encrypted = matrix[new_row1][col1] + matrix[new_row2][col2]
-                step_info["rule"] = "Same Column (shift down)"
-            else:
-                # Rectangle - swap columns
-                encrypted = matrix[row1][col2] + matrix[row2][col1]
-                step_info["rule"] = "Rectangle (swap columns)"
-
-            step_info["encrypted"] = encrypted
-            steps.append(step_info)
-            result += encrypted
+        prepared = ''.join(digraphs)
+
+        # Whole transform is one gather into the precomputed pair table
+        enc_table, _ = PlayfairCipher._build_cipher_tables(flat)
+        result = PlayfairCipher._apply_table(prepared, enc_table)
+
+        steps = None
+        if include_steps:
+            # Rule labels for the steps still come from the position table
+            pos_table = PlayfairCipher._build_position_table(flat)
+
+            steps = []
+            # Locals for the per-digraph loop: LOAD_FAST instead of
+            # attribute/global lookups on every iteration
+            append = steps.append
+            table = pos_table
+            for i, digraph in enumerate(digraphs):
+                row1, col1 = divmod(table[ord(digraph[0])], 5)
+                row2, col2 = divmod(table[ord(digraph[1])], 5)
+
+                if row1 == row2:
+                    rule = "Same Row (shift right)"
+                elif col1 == col2:
+                    rule = "Same Column (shift down)"
+                else:
+                    rule = "Rectangle (swap columns)"
+
+                append({
+                    "digraph": digraph,
+                    "pos1": f"({row1},{col1})",
+                    "pos2": f"({row2},{col2})",
+                    "rule": rule,
+                    "encrypted": result[2 * i:2 * i + 2],
+                })
 
         return {
             "result": result,
             "steps": steps,
-            "matrix": matrix,
+            "matrix": [list(flat[i:i + 5]) for i in range(0, 25, 5)],
             "keyword": keyword.upper(),
             "prepared_text": ''.join(digraphs),
             "digraphs": digraphs,
@@ -192,68 +348,67 @@ class PlayfairCipher:
         }
 
     @staticmethod
-    def decrypt(ciphertext: str, keyword: str) -> Dict[str, Any]:
+    def decrypt(ciphertext: str, keyword: str, *, include_steps: bool = False) -> Dict[str, Any]:
         """
         Decrypt ciphertext using Playfair cipher.
 
         Args:
             ciphertext: Text to decrypt
             keyword: Keyword used for encryption
+            include_steps: Whether to build the step-by-step breakdown
 
         Returns:
             Dictionary with result and step-by-step breakdown
         """
-        matrix = PlayfairCipher.generate_matrix(keyword)
+        flat = PlayfairCipher._generate_flat(keyword)
 
         # Clean ciphertext
-        ciphertext = ciphertext.upper().replace('J', 'I')
-        ciphertext = ''.join(c for c in ciphertext if c.isalpha())
+        ciphertext = _clean(ciphertext)
 
         # Split into digraphs
         digraphs = [ciphertext[i:i + 2] for i in range(0, len(ciphertext), 2)]
 
-        result = ""
-        steps = []
-
-        for digraph in digraphs:
-            if len(digraph) < 2:
-                continue
-
-            char1, char2 = digraph[0], digraph[1]
-            row1, col1 = PlayfairCipher.find_position(matrix, char1)
-            row2, col2 = PlayfairCipher.find_position(matrix, char2)
-
-            step_info = {
-                "digraph": digraph,
-                "pos1": f"({row1},{col1})",
-                "pos2": f"({row2},{col2})",
-            }
-
-            if row1 == row2:
-                # Same row - shift left
-                new_col1 = (col1 - 1) % 5
-                new_col2 = (col2 - 1) % 5
-                decrypted = matrix[row1][new_col1] + matrix[row2][new_col2]
-                step_info["rule"] = "Same Row (shift left)"
-            elif col1 == col2:
-                # Same column - shift up
-                new_row1 = (row1 - 1) % 5
-                new_row2 = (row2 - 1) % 5
-                decrypted = matrix[new_row1][col1] + matrix[new_row2][col2]
-                step_info["rule"] = "Same Column (shift up)"
-            else:
-                # Rectangle - swap columns (same as encryption)
-                decrypted = matrix[row1][col2] + matrix[row2][col1]
-                step_info["rule"] = "Rectangle (swap columns)"
-
-            step_info["decrypted"] = decrypted
-            steps.append(step_info)
-            result += decrypted
+        # Whole transform is one gather; a trailing odd letter is dropped,
+        # matching the per-digraph loop below
+        _, dec_table = PlayfairCipher._build_cipher_tables(flat)
+        result = PlayfairCipher._apply_table(ciphertext[:len(ciphertext) // 2 * 2], dec_table)
+
+        steps = None
+        if include_steps:
+            # Rule labels for the steps still come from the position table
+            pos_table = PlayfairCipher._build_position_table(flat)
+
+            steps = []
+            # Locals for the per-digraph loop: LOAD_FAST instead of
+            # attribute/global lookups on every iteration
+            append = steps.append
+            table = pos_table
+            for i, digraph in enumerate(digraphs):
+                if len(digraph) < 2:
+                    continue
+
+                row1, col1 = divmod(table[ord(digraph[0])], 5)
+                row2, col2 = divmod(table[ord(digraph[1])], 5)
+
+                if row1 == row2:
+                    rule = "Same Row (shift left)"
+                elif col1 == col2:
+                    rule = "Same Column (shift up)"
+                else:
+                    rule = "Rectangle (swap columns)"
+
+                append({
+                    "digraph": digraph,
+                    "pos1": f"({row1},{col1})",
+                    "pos2": f"({row2},{col2})",
+                    "rule": rule,
+                    "decrypted": result[2 * i:2 * i + 2],
+                })
 
         return {
             "result": result,
             "steps": steps,
-            "matrix": matrix,
+            "matrix": [list(flat[i:i + 5]) for i in range(0, 25, 5)],
             "keyword": keyword.upper(),
             "digraphs": digraphs,
             "operation": "decrypt"
@@ -12,6 +12,7 @@ Author: CryptoLab Team
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .routes import cipher_router
 
@@ -54,6 +55,8 @@ Built with FastAPI and Python
     contact={
         "name": "CryptoLab",
     },
+    # orjson serializes the step-heavy cipher payloads in C
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS for frontend access
@@ -16,22 +16,26 @@ router = APIRouter()
 class CaesarRequest(BaseModel):
     text: str = Field(..., description="Text to encrypt/decrypt")
     shift: int = Field(..., ge=0, le=25, description="Shift value (0-25)")
+    include_steps: bool = Field(False, description="Include the step-by-step breakdown in the response")
 
 
 class AffineRequest(BaseModel):
     text: str = Field(..., description="Text to encrypt/decrypt")
     a: int = Field(..., description="Multiplicative key (must be coprime with 26)")
     b: int = Field(..., ge=0, le=25, description="Additive key (0-25)")
+    include_steps: bool = Field(False, description="Include the step-by-step breakdown in the response")
 
 
 class PlayfairRequest(BaseModel):
     text: str = Field(..., description="Text to encrypt/decrypt")
     keyword: str = Field(..., description="Keyword for matrix generation")
+    include_steps: bool = Field(False, description="Include the step-by-step breakdown in the response")
 
 
 class HillRequest(BaseModel):
     text: str = Field(..., description="Text to encrypt/decrypt")
     matrix: List[List[int]] = Field(..., description="2x2 key matrix")
+    include_steps: bool = Field(False, description="Include the step-by-step breakdown in the response")
 
 
 class HillCrackRequest(BaseModel):
@@ -49,7 +53,7 @@ async def caesar_encrypt(request: CaesarRequest):
     - **text**: The plaintext to encrypt
     - **shift**: Number of positions to shift (0-25)
     """
-    result = CaesarCipher.encrypt(request.text, request.shift)
+    result = CaesarCipher.encrypt(request.text, request.shift, include_steps=request.include_steps)
     return result
 
 
@@ -61,7 +65,7 @@ async def caesar_decrypt(request: CaesarRequest):
     - **text**: The ciphertext to decrypt
     - **shift**: The shift value used for encryption
     """
-    result = CaesarCipher.decrypt(request.text, request.shift)
+    result = CaesarCipher.decrypt(request.text, request.shift, include_steps=request.include_steps)
     return result
 
 
@@ -90,7 +94,7 @@ async def affine_encrypt(request: AffineRequest):
 
     Valid 'a' values: 1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25
     """
-    result = AffineCipher.encrypt(request.text, request.a, request.b)
+    result = AffineCipher.encrypt(request.text, request.a, request.b, include_steps=request.include_steps)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -107,7 +111,7 @@ async def affine_decrypt(request: AffineRequest):
     - **a**: Multiplicative key used for encryption
     - **b**: Additive key used for encryption
     """
-    result = AffineCipher.decrypt(request.text, request.a, request.b)
+    result = AffineCipher.decrypt(request.text, request.a, request.b, include_steps=request.include_steps)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -136,7 +140,7 @@ async def playfair_encrypt(request: PlayfairRequest):
     - **text**: The plaintext to encrypt
     - **keyword**: Keyword to generate the 5x5 matrix
     """
-    result = PlayfairCipher.encrypt(request.text, request.keyword)
+    result = PlayfairCipher.encrypt(request.text, request.keyword, include_steps=request.include_steps)
     return result
 
 
@@ -148,7 +152,7 @@ async def playfair_decrypt(request: PlayfairRequest):
     - **text**: The ciphertext to decrypt
     - **keyword**: Keyword used for encryption
     """
-    result = PlayfairCipher.decrypt(request.text, request.keyword)
+    result = PlayfairCipher.decrypt(request.text, request.keyword, include_steps=request.include_steps)
     return result
 
 
@@ -174,7 +178,7 @@ async def hill_encrypt(request: HillRequest):
     - **text**: The plaintext to encrypt
     - **matrix**: 2x2 key matrix (must be invertible mod 26)
     """
-    result = HillCipher.encrypt(request.text, request.matrix)
+    result = HillCipher.encrypt(request.text, request.matrix, include_steps=request.include_steps)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -190,7 +194,7 @@ async def hill_decrypt(request: HillRequest):
     - **text**: The ciphertext to decrypt
     - **matrix**: 2x2 key matrix used for encryption
     """
-    result = HillCipher.decrypt(request.text, request.matrix)
+    result = HillCipher.decrypt(request.text, request.matrix, include_steps=request.include_steps)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
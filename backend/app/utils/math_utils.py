@@ -3,6 +3,8 @@ Mathematical utility functions for cryptographic operations.
 Includes modular arithmetic and matrix operations.
 """
 
+import math
+
 import numpy as np
 from typing import Optional, Tuple, List
 
@@ -33,10 +35,8 @@ def gcd(a: int, b: int) -> int:
     Returns:
         GCD of a and b
     """
-    a, b = abs(a), abs(b)
-    while b:
-        a, b = b, a % b
-    return a
+    # math.gcd runs the Euclidean algorithm in C and handles negatives
+    return math.gcd(a, b)
 
 
 def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
@@ -44,6 +44,10 @@ def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
     Extended Euclidean Algorithm.
     Finds gcd(a, b) and coefficients x, y such that: ax + by = gcd(a, b)
 
+    Deprecated: nothing in the package calls this anymore — mod_inverse
+    uses pow(a, -1, m) and gcd wraps math.gcd. Kept only because it is
+    part of the exported utils API.
+
     Args:
         a: First number
         b: Second number
@@ -51,14 +55,19 @@ def extended_gcd(a: int, b: int) -> Tuple[int, int, int]:
     Returns:
         Tuple of (gcd, x, y)
     """
-    if a == 0:
-        return b, 0, 1
+    # Iterative form: same quotients as the recursive version without the
+    # call-stack overhead (or recursion limit) per division step
+    old_r, r = a, b
+    old_s, s = 1, 0
+    old_t, t = 0, 1
 
-    gcd_val, x1, y1 = extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+        old_t, t = t, old_t - q * t
 
-    return gcd_val, x, y
+    return old_r, old_s, old_t
 
 
 def mod_inverse(a: int, m: int) -> Optional[int]:
@@ -73,13 +82,12 @@ def mod_inverse(a: int, m: int) -> Optional[int]:
     Returns:
         Modular inverse if it exists, None otherwise
     """
-    gcd_val, x, _ = extended_gcd(mod(a, m), m)
-
-    if gcd_val != 1:
+    # Built-in pow runs the extended Euclidean algorithm in C
+    try:
+        return pow(a % m, -1, m)
+    except ValueError:
         return None  # Inverse doesn't exist
 
-    return mod(x, m)
-
 
 def matrix_multiply_mod(A: List[List[int]], B: List[List[int]], m: int) -> List[List[int]]:
     """
@@ -95,12 +103,12 @@ def matrix_multiply_mod(A: List[List[int]], B: List[List[int]], m: int) -> List[
     """
     result = [
         [
-            mod(A[0][0] * B[0][0] + A[0][1] * B[1][0], m),
-            mod(A[0][0] * B[0][1] + A[0][1] * B[1][1], m)
+            (A[0][0] * B[0][0] + A[0][1] * B[1][0]) % m,
+            (A[0][0] * B[0][1] + A[0][1] * B[1][1]) % m
         ],
         [
-            mod(A[1][0] * B[0][0] + A[1][1] * B[1][0], m),
-            mod(A[1][0] * B[0][1] + A[1][1] * B[1][1], m)
+            (A[1][0] * B[0][0] + A[1][1] * B[1][0]) % m,
+            (A[1][0] * B[0][1] + A[1][1] * B[1][1]) % m
         ]
     ]
     return result
@@ -119,11 +127,29 @@ def matrix_vector_multiply_mod(M: List[List[int]], v: List[int], m: int) -> List
         Result vector (M × v) mod m
     """
     return [
-        mod(M[0][0] * v[0] + M[0][1] * v[1], m),
-        mod(M[1][0] * v[0] + M[1][1] * v[1], m)
+        (M[0][0] * v[0] + M[0][1] * v[1]) % m,
+        (M[1][0] * v[0] + M[1][1] * v[1]) % m
     ]
 
 
+def matrix_blocks_multiply_mod(K: List[List[int]], blocks: np.ndarray, m: int) -> np.ndarray:
+    """
+    Multiply a 2x2 matrix with many column vectors at once under modulo m.
+
+    Packs the per-block work of matrix_vector_multiply_mod into a single
+    NumPy matmul, so N blocks cost one C call instead of N Python calls.
+
+    Args:
+        K: 2x2 matrix
+        blocks: (2, N) integer array, one column vector per block
+        m: Modulus
+
+    Returns:
+        (2, N) array of (K × blocks) mod m
+    """
+    return (np.asarray(K, dtype=np.int32) @ blocks) % m
+
+
 def determinant_2x2(M: List[List[int]]) -> int:
     """
     Calculate determinant of a 2x2 matrix.
@@ -137,6 +163,23 @@ def determinant_2x2(M: List[List[int]]) -> int:
     return M[0][0] * M[1][1] - M[0][1] * M[1][0]
 
 
+def det_inverse_mod_26(M: List[List[int]]) -> Optional[int]:
+    """
+    Calculate the modular inverse of det(M) under modulo 26.
+
+    Single primitive for the invertibility question: callers needing a
+    boolean test `is not None`, callers needing the inverse use the value,
+    so the determinant and gcd are not computed twice in sequence.
+
+    Args:
+        M: 2x2 matrix
+
+    Returns:
+        Inverse of the determinant if it exists, None otherwise
+    """
+    return mod_inverse(determinant_2x2(M) % 26, 26)
+
+
 def matrix_inverse_mod_26(M: List[List[int]]) -> Optional[List[List[int]]]:
     """
     Calculate inverse of a 2x2 matrix under modulo 26.
@@ -147,11 +190,7 @@ def matrix_inverse_mod_26(M: List[List[int]]) -> Optional[List[List[int]]]:
     Returns:
         Inverse matrix if it exists, None otherwise
     """
-    det = determinant_2x2(M)
-    det_mod = mod(det, 26)
-
-    # Find modular inverse of determinant
-    det_inv = mod_inverse(det_mod, 26)
+    det_inv = det_inverse_mod_26(M)
 
     if det_inv is None:
         return None  # Matrix is not invertible mod 26
@@ -162,10 +201,11 @@ def matrix_inverse_mod_26(M: List[List[int]]) -> Optional[List[List[int]]]:
         [-M[1][0], M[0][0]]
     ]
 
-    # Inverse = det^(-1) × adjugate (mod 26)
+    # Inverse = det^(-1) × adjugate (mod 26); Python's % is already
+    # non-negative for the negated off-diagonal terms
     inverse = [
-        [mod(det_inv * adjugate[0][0], 26), mod(det_inv * adjugate[0][1], 26)],
-        [mod(det_inv * adjugate[1][0], 26), mod(det_inv * adjugate[1][1], 26)]
+        [det_inv * adjugate[0][0] % 26, det_inv * adjugate[0][1] % 26],
+        [det_inv * adjugate[1][0] % 26, det_inv * adjugate[1][1] % 26]
     ]
 
     return inverse
@@ -181,5 +221,5 @@ def is_matrix_invertible_mod_26(M: List[List[int]]) -> bool:
     Returns:
         True if invertible, False otherwise
     """
-    det = mod(determinant_2x2(M), 26)
+    det = determinant_2x2(M) % 26
     return gcd(det, 26) == 1
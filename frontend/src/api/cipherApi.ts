@@ -19,12 +19,12 @@ const api = axios.create({
 // Caesar Cipher API
 export const caesarApi = {
   encrypt: async (text: string, shift: number): Promise<CaesarResponse> => {
-    const response = await api.post('/caesar/encrypt', { text, shift })
+    const response = await api.post('/caesar/encrypt', { text, shift, include_steps: true })
     return response.data
   },
 
   decrypt: async (text: string, shift: number): Promise<CaesarResponse> => {
-    const response = await api.post('/caesar/decrypt', { text, shift })
+    const response = await api.post('/caesar/decrypt', { text, shift, include_steps: true })
     return response.data
   },
 
@@ -37,12 +37,12 @@ export const caesarApi = {
 // Affine Cipher API
 export const affineApi = {
   encrypt: async (text: string, a: number, b: number): Promise<AffineResponse> => {
-    const response = await api.post('/affine/encrypt', { text, a, b })
+    const response = await api.post('/affine/encrypt', { text, a, b, include_steps: true })
     return response.data
   },
 
   decrypt: async (text: string, a: number, b: number): Promise<AffineResponse> => {
-    const response = await api.post('/affine/decrypt', { text, a, b })
+    const response = await api.post('/affine/decrypt', { text, a, b, include_steps: true })
     return response.data
   },
 
@@ -55,12 +55,12 @@ export const affineApi = {
 // Playfair Cipher API
 export const playfairApi = {
   encrypt: async (text: string, keyword: string): Promise<PlayfairResponse> => {
-    const response = await api.post('/playfair/encrypt', { text, keyword })
+    const response = await api.post('/playfair/encrypt', { text, keyword, include_steps: true })
     return response.data
   },
 
   decrypt: async (text: string, keyword: string): Promise<PlayfairResponse> => {
-    const response = await api.post('/playfair/decrypt', { text, keyword })
+    const response = await api.post('/playfair/decrypt', { text, keyword, include_steps: true })
     return response.data
   },
 
@@ -73,12 +73,12 @@ export const playfairApi = {
 // Hill Cipher API
 export const hillApi = {
   encrypt: async (text: string, matrix: number[][]): Promise<HillResponse> => {
-    const response = await api.post('/hill/encrypt', { text, matrix })
+    const response = await api.post('/hill/encrypt', { text, matrix, include_steps: true })
     return response.data
   },
 
   decrypt: async (text: string, matrix: number[][]): Promise<HillResponse> => {
-    const response = await api.post('/hill/decrypt', { text, matrix })
+    const response = await api.post('/hill/decrypt', { text, matrix, include_steps: true })
     return response.data
   },
 
@@ -12,7 +12,7 @@ export interface CaesarStep {
 
 export interface CaesarResponse {
   result: string
-  steps: CaesarStep[]
+  steps: CaesarStep[] | null
   shift: number
   operation: 'encrypt' | 'decrypt'
 }
@@ -33,7 +33,7 @@ export interface AffineStep {
 
 export interface AffineResponse {
   result: string
-  steps: AffineStep[]
+  steps: AffineStep[] | null
   key: { a: number; b: number }
   a_inverse: number
   formula: string
@@ -52,7 +52,7 @@ export interface PlayfairStep {
 
 export interface PlayfairResponse {
   result: string
-  steps: PlayfairStep[]
+  steps: PlayfairStep[] | null
   matrix: string[][]
   keyword: string
   prepared_text?: string
@@ -71,7 +71,7 @@ export interface HillStep {
 
 export interface HillResponse {
   result: string
-  steps: HillStep[]
+  steps: HillStep[] | null
   key_matrix: number[][]
   inverse_matrix: number[][] | null
   determinant: number